@@ -0,0 +1,117 @@
+import unicodedata
+from typing import Any, Dict, List, Sequence
+
+# Normalleştirme kuralları değiştiğinde artırılır; saklanan cevaplar farklı sürümdeyse yeniden hesaplanır
+ANSWER_FORMS_VERSION = 2
+
+# Tek geçişte Türkçe büyük/küçük harf ve şapka dönüşümü, ardından str.lower():
+# - str.lower() "İ" harfini "i̇" (i + birleşik nokta) yapar ve "I" harfini "ı" yerine "i" yapar
+# - şapkalı harfler (kâr, hâlâ) şapkasız yazımla eşleşsin; ç, ğ, ı, ö, ş, ü ayrı harf olarak kalır
+# - "i" + U+0307 birleşik biçimi olmadığından NFC sonrası da ayrık kalır; Türkçe dışı
+#   küçültmeyle "İ" harfinden üretilmiş metinlerde (ör. başka yerden kopyalanan cevaplar) görülür ve atılır
+_TURKISH_FOLD = str.maketrans({
+    "İ": "i", "I": "ı",
+    "â": "a", "Â": "a", "î": "i", "Î": "i", "û": "u", "Û": "u",
+    "\u0307": None
+})
+
+
+def _compose(text: str) -> str:
+    """Ayrık yazılmış karakterleri (ör. "I" + U+0307) birleştirir; gerekmiyorsa metni olduğu gibi döndürür"""
+    if text.isascii() or unicodedata.is_normalized("NFC", text):
+        return text
+    return unicodedata.normalize("NFC", text)
+
+
+def _fold(text: str) -> str:
+    return " ".join(text.translate(_TURKISH_FOLD).lower().split())
+
+
+def normalize_answer(text: str) -> str:
+    """Cevabı karşılaştırma için normalleştirir (Türkçe küçük harf, şapka ve boşluk temizliği)"""
+    return _fold(_compose(text))
+
+
+def answer_forms(text: str) -> List[str]:
+    """Cevabın karşılaştırılacak biçimleri: Türkçe normalleştirme, metinde "I" varsa "I" -> "i" biçimi de"""
+    text = _compose(text)
+    forms = [_fold(text)]
+    if "I" in text:
+        # Türkçe olmayan klavye, Caps Lock ya da "Istanbul" gibi yazımlar
+        forms.append(_fold(text.replace("I", "i")))
+    return forms
+
+
+def compile_answers(correct_answers: str) -> List[str]:
+    """Noktalı virgülle ayrılmış doğru cevapları bir kez normalleştirip tekrarsız liste olarak döndürür"""
+    variants = []
+    for answer in correct_answers.split(';'):
+        for form in answer_forms(answer):
+            if form and form not in variants:
+                variants.append(form)
+    return variants
+
+
+def within_edit_distance(a: str, b: str, max_distance: int) -> bool:
+    """İki metin arasındaki Levenshtein mesafesinin max_distance değerini aşmadığını kontrol eder"""
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+
+    # Sadece köşegen çevresindeki |i - j| <= max_distance bandı hesaplanır; bandın dışı sınırı zaten aşar
+    over = max_distance + 1
+    previous = [j if j <= max_distance else over for j in range(len(b) + 1)]
+    for i, char_a in enumerate(a, start=1):
+        start = max(1, i - max_distance)
+        end = min(len(b), i + max_distance)
+        current = [over] * (len(b) + 1)
+        if i <= max_distance:
+            current[0] = i
+        for j in range(start, end + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != b[j - 1])
+            )
+        # Bantta sınırı aşmayan değer kalmadıysa sonuç da aşar
+        if min(current[start - 1:end + 1]) > max_distance:
+            return False
+        previous = current
+    return previous[-1] <= max_distance
+
+
+def allowed_typos(variant: str, max_typos: int) -> int:
+    """Cevap uzunluğuna göre izin verilen hata sayısı: 3 harfe kadar 0, sonrası en fazla uzunluğun %20'si"""
+    if len(variant) <= 3:
+        return 0
+    return min(max_typos, len(variant) // 5)
+
+
+def match_answer(student_answer: str, variants: Sequence[str], max_typos: int = 0) -> bool:
+    """Öğrenci cevabını önceden normalleştirilmiş cevaplarla karşılaştırır, isteğe bağlı yazım hatası toleransı ile"""
+    candidates = answer_forms(student_answer)
+    if not candidates[0]:
+        return False
+
+    # Kelime başına 1-5 cevap olduğundan liste üzerinde arama yeterli
+    if any(candidate in variants for candidate in candidates):
+        return True
+
+    if max_typos <= 0:
+        return False
+    for variant in variants:
+        limit = allowed_typos(variant, max_typos)
+        if limit and any(within_edit_distance(candidate, variant, limit) for candidate in candidates):
+            return True
+    return False
+
+
+def check_answer(student_answer: str, word: Dict[str, Any], max_typos: int = 0) -> bool:
+    """Öğrenci cevabını kelimenin önceden normalleştirilmiş cevaplarıyla kontrol eder"""
+    if word.get("turkish_normalized_version") == ANSWER_FORMS_VERSION:
+        variants = word["turkish_normalized"]
+    else:
+        # Normalleştirilmiş cevapları saklanmamış ya da eski kurallarla saklanmış kayıtlar
+        variants = compile_answers(word["turkish"])
+    return match_answer(student_answer, variants, max_typos=max_typos)
@@ -14,6 +14,8 @@ import csv
 import io
 import hashlib
 
+from answer_matcher import ANSWER_FORMS_VERSION, check_answer, compile_answers
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
@@ -22,6 +24,9 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Yazım hatası toleransı (Levenshtein mesafesi, 0 = sadece tam eşleşme)
+ANSWER_MAX_TYPOS = int(os.environ.get('ANSWER_MAX_TYPOS', '0'))
+
 # Create the main app without a prefix
 app = FastAPI()
 
@@ -93,12 +98,6 @@ def get_today_date():
     """Bugünün tarihini ISO format string olarak döndürür"""
     return date.today().isoformat()
 
-def check_answer(student_answer: str, correct_answers: str) -> bool:
-    """Öğrenci cevabını kontrol eder. Çoklu cevapları noktalı virgülle ayrılmış şekilde destekler"""
-    student_answer = student_answer.strip().lower()
-    answers = [answer.strip().lower() for answer in correct_answers.split(';')]
-    return student_answer in answers
-
 async def get_next_word_for_student(student_code: str) -> Optional[Dict[str, Any]]:
     """5 kutu yöntemiyle öğrenci için sonraki kelimeyi getirir"""
     # Öğrenciyi bul
@@ -244,8 +243,20 @@ async def submit_answer(session: StudySession):
     if not word:
         raise HTTPException(status_code=404, detail="Kelime bulunamadı")
     
+    # Eski ya da eski kurallarla saklanmış kayıtlar: normalleştirilmiş cevapları bir kez hesaplayıp sakla
+    if word.get("turkish_normalized_version") != ANSWER_FORMS_VERSION:
+        word["turkish_normalized"] = compile_answers(word["turkish"])
+        word["turkish_normalized_version"] = ANSWER_FORMS_VERSION
+        await db.words.update_one(
+            {"id": session.word_id},
+            {"$set": {
+                "turkish_normalized": word["turkish_normalized"],
+                "turkish_normalized_version": ANSWER_FORMS_VERSION
+            }}
+        )
+    
     # Cevabı kontrol et
-    is_correct = check_answer(session.answer, word["turkish"])
+    is_correct = check_answer(session.answer, word, max_typos=ANSWER_MAX_TYPOS)
     
     # İlerlemeyi güncelle
     await update_word_progress(session.student_code, session.word_id, is_correct)
@@ -352,7 +363,12 @@ async def upload_words(file: UploadFile = File(...)):
                 english=row["english"],
                 turkish=row["turkish"]
             )
-            await db.words.insert_one(word.dict())
+            # Normalleştirilmiş cevaplar sadece veritabanında tutulur, API yanıtına girmez
+            await db.words.insert_one({
+                **word.dict(),
+                "turkish_normalized": compile_answers(row["turkish"]),
+                "turkish_normalized_version": ANSWER_FORMS_VERSION
+            })
             added_count += 1
     
     return {
@@ -0,0 +1,50 @@
+"""Cevap kontrolü mikro ölçümü: python tests/benchmark_answer_matcher.py
+
+Yeni kontrol Türkçe normalleştirme yaptığı için eski .lower() kontrolünden birkaç µs yavaştır;
+bu fark istek başına yapılan veritabanı sorgularının yanında önemsizdir.
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from answer_matcher import ANSWER_FORMS_VERSION, check_answer, compile_answers  # noqa: E402
+
+NUMBER = 100_000
+TURKISH = "İyi;ılık;merhaba;selam;kâr;hoş geldiniz"
+
+# Veritabanından gelen belgeler gibi: saklanan cevaplar liste olarak döner
+STORED_WORD = {"id": "1", "class_name": "5A", "english": "welcome", "turkish": TURKISH,
+               "turkish_normalized": compile_answers(TURKISH),
+               "turkish_normalized_version": ANSWER_FORMS_VERSION}
+LEGACY_WORD = {"id": "2", "class_name": "5A", "english": "welcome", "turkish": TURKISH}
+
+
+def legacy_check_answer(student_answer: str, correct_answers: str) -> bool:
+    """Önceki uygulama: her kontrolde ayrıştırma ve str.lower()"""
+    student_answer = student_answer.strip().lower()
+    answers = [answer.strip().lower() for answer in correct_answers.split(';')]
+    return student_answer in answers
+
+
+def main():
+    answers = {
+        "tam eşleşme": "  Hoş geldiniz ",
+        "eşleşme yok": "yanlış cevap",
+        "yazım hatası": "hos geldiniz",
+    }
+    for label, answer in answers.items():
+        cases = [
+            ("eski kontrol", lambda: legacy_check_answer(answer, LEGACY_WORD["turkish"])),
+            ("saklanan cevaplar", lambda: check_answer(answer, STORED_WORD)),
+            ("saklanan cevaplar, 1 hata", lambda: check_answer(answer, STORED_WORD, max_typos=1)),
+            ("eski kayıt (yedek yol)", lambda: check_answer(answer, LEGACY_WORD)),
+        ]
+        for name, func in cases:
+            seconds = timeit.timeit(func, number=NUMBER)
+            print(f"{label:<13} {name:<26} {seconds / NUMBER * 1e6:6.2f} µs/kontrol")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# backend modülleri sunucu gibi doğrudan içe aktarılabilsin
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
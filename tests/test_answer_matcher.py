@@ -0,0 +1,103 @@
+import unicodedata
+
+import pytest
+
+from answer_matcher import (
+    ANSWER_FORMS_VERSION, answer_forms, check_answer, compile_answers, match_answer, normalize_answer,
+    within_edit_distance
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("İYİ", "iyi"),
+    ("iyi", "iyi"),
+    ("IŞIK", "ışık"),
+    ("ılık", "ılık"),
+    ("i̇yi", "iyi"),  # Türkçe dışı .lower() çıktısı: i + U+0307
+    ("Kâr", "kar"),
+    ("HÂLÂ", "hala"),
+    ("  hoş \t geldiniz \n", "hoş geldiniz"),
+    ("", ""),
+])
+def test_normalize_answer(text, expected):
+    assert normalize_answer(text) == expected
+
+
+@pytest.mark.parametrize("text", ["İYİ", "IŞIK", "Kâr", "Öğrenci"])
+def test_normalize_answer_nfd_matches_nfc(text):
+    assert normalize_answer(unicodedata.normalize("NFD", text)) == normalize_answer(text)
+
+
+def test_compile_answers_dedupes_and_skips_empty_segments():
+    assert compile_answers("İyi; iyi ;;  ;Güzel;güzel;") == ["iyi", "güzel"]
+
+
+def test_compile_answers_empty():
+    assert compile_answers("") == []
+
+
+def test_answer_forms_ascii_capital_i():
+    assert answer_forms("Istanbul") == ["ıstanbul", "istanbul"]
+    assert answer_forms("İyi") == ["iyi"]
+
+
+def test_compile_answers_stores_both_capital_i_forms():
+    assert compile_answers("IYI;Işık") == ["ıyı", "iyi", "ışık", "işık"]
+    assert match_answer("iyi", compile_answers("IYI"))
+    assert match_answer("istanbul", compile_answers("Istanbul"))
+    assert match_answer("ılık", compile_answers("Ilık"))
+
+
+@pytest.mark.parametrize("a, b, max_distance, expected", [
+    ("kitap", "kitap", 0, True),
+    ("kitap", "kitab", 0, False),
+    ("kitap", "kitab", 1, True),
+    ("kitap", "kitp", 1, True),
+    ("kitap", "kitapp", 1, True),
+    ("kitap", "ktp", 1, False),
+    ("kitap", "katab", 1, False),
+    ("", "a", 0, False),
+    ("", "a", 1, True),
+])
+def test_within_edit_distance(a, b, max_distance, expected):
+    assert within_edit_distance(a, b, max_distance) is expected
+
+
+def test_match_answer_ascii_capital_i_also_matches_dotted_i():
+    assert match_answer("IYI", ["iyi"])
+    assert match_answer("IŞIK", ["ışık"])
+
+
+def test_match_answer_typos_scale_with_length():
+    assert not match_answer("a", ["o"], max_typos=1)
+    assert not match_answer("ev", ["el"], max_typos=1)
+    assert not match_answer("kedi", ["kedü"], max_typos=1)  # 4 harf: hata kabul edilmez
+    assert match_answer("kitab", ["kitap"], max_typos=1)  # 5 harf: 1 hata
+    assert match_answer("merhabe", ["merhaba"], max_typos=1)
+    assert not match_answer("merhabe", ["merhaba"], max_typos=0)
+    assert not match_answer("merhbe", ["merhaba"], max_typos=2)  # 7 harf: en fazla 1 hata
+
+
+def test_match_answer_empty_answer():
+    assert not match_answer("   ", ["iyi"], max_typos=1)
+
+
+def test_check_answer_stored_variants():
+    word = {"id": "1", "turkish": "eski;değer", "turkish_normalized": ["merhaba", "selam"],
+            "turkish_normalized_version": ANSWER_FORMS_VERSION}
+    assert check_answer(" SELAM ", word)
+    # Saklanan cevaplar varsa turkish alanı tekrar ayrıştırılmaz
+    assert not check_answer("eski", word)
+
+
+def test_check_answer_legacy_fallback():
+    word = {"id": "1", "turkish": "İyi;Hoş geldiniz"}
+    assert check_answer("iyi", word)
+    assert check_answer("HOŞ  GELDİNİZ", word)
+    assert not check_answer("kötü", word)
+
+
+def test_check_answer_recompiles_stale_version():
+    # Önceki kurallarla (sürüm bilgisi olmadan) saklanmış yanlış cevaplar kullanılmaz
+    word = {"id": "1", "turkish": "IYI", "turkish_normalized": ["ıyı"]}
+    assert check_answer("iyi", word)